@@ -11,7 +11,7 @@ from typing import Any, List
 import unittest
 from dataclasses import dataclass
 
-from qualifier import make_table
+from qualifier import CACHE_MAX_CELLS, make_table, make_table_cached
 
 
 @dataclass
@@ -762,3 +762,38 @@ class MakeTableTests(unittest.TestCase):
 
         for case in cases:
             self.run_against_solution(case, fail_msg="Couldn't handle lots of cols.")
+
+    def test_012_mutated_rows(self) -> None:
+        for render in (make_table, make_table_cached):
+            rows = [["Apple", 5], ["Banana", 3]]
+            first = render(rows, labels=["Fruit", "Tastiness"])
+            rows[1][0] = "Strawberry"
+            second = render(rows, labels=["Fruit", "Tastiness"])
+
+            self.assertEqual(
+                first,
+                '┌────────┬───────────┐\n'
+                '│ Fruit  │ Tastiness │\n'
+                '├────────┼───────────┤\n'
+                '│ Apple  │ 5         │\n'
+                '│ Banana │ 3         │\n'
+                '└────────┴───────────┘'
+            )
+            self.assertEqual(
+                second,
+                '┌────────────┬───────────┐\n'
+                '│ Fruit      │ Tastiness │\n'
+                '├────────────┼───────────┤\n'
+                '│ Apple      │ 5         │\n'
+                '│ Strawberry │ 3         │\n'
+                '└────────────┴───────────┘',
+                msg=f"{render.__name__} did not reflect a row mutated between calls."
+            )
+
+    def test_013_cache_skips_large_tables(self) -> None:
+        small = [["Just", "Another", "Row"]]
+        large = [["Just", "Another", "Row"] for _ in range(CACHE_MAX_CELLS // 3 + 1)]
+
+        self.assertIs(make_table_cached(small), make_table_cached(small), msg="A small table was not cached.")
+        self.assertEqual(make_table_cached(large), make_table(large))
+        self.assertIsNot(make_table_cached(large), make_table_cached(large), msg="A large table was cached.")
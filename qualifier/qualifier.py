@@ -1,6 +1,6 @@
-import math
-from itertools import zip_longest
-from typing import Any, List, Optional
+from functools import lru_cache
+from itertools import chain, islice, starmap
+from typing import Any, List, Optional, Sequence, Tuple
 
 BORDER = {
     "top": ["┌", "┬", "┐"],
@@ -9,18 +9,14 @@ BORDER = {
 }
 VERTICAL = "│"
 HORIZONTAL = "─"
+CACHE_MAX_CELLS = 1_000  # larger tables bypass `make_table_cached`
 
 
-def make_horizontal_rule(column_widths: List[int], which: str):
-    """Makes a horizontal rule with the set of left, column, and right borders labeled by `which`"""
+def make_horizontal_rule(segments: Sequence[str], which: str) -> str:
+    """Makes a horizontal rule out of the per-column horizontal `segments`, with the set of left, column,
+    and right borders labeled by `which`"""
     borders = BORDER[which]
-    return (
-        borders[0]
-        + borders[1].join(
-            HORIZONTAL * (column_width + 2) for column_width in column_widths  # +2 for padding
-        )
-        + borders[2]
-    )
+    return borders[0] + borders[1].join(segments) + borders[2]
 
 
 def make_table(
@@ -33,50 +29,87 @@ def make_table(
     :param centered: If the items should be aligned to the center, else they are left aligned.
     :return: A table representing the rows passed in.
     """
-    # Make sure all rows have the same number of columns
-    assert len(set(n_cols := len(row) for row in rows)) == 1
-    column_widths = [0] * n_cols
+    return _render_table(*_stringify(rows, labels), centered)
+
+
+def make_table_cached(
+    rows: List[List[Any]], labels: Optional[List[Any]] = None, centered: bool = False
+) -> str:
+    """
+    Same as `make_table`, but remembers the most recently rendered small tables, for callers that redraw
+    the same table repeatedly. Tables with more than `CACHE_MAX_CELLS` cells are rendered without caching
+    so that a one-off large table is never kept alive.
+
+    :param rows: 2D list containing objects that have a single-line representation (via `str`).
+    All rows must be of the same length.
+    :param labels: List containing the column labels. If present, the length must equal to that of each row.
+    :param centered: If the items should be aligned to the center, else they are left aligned.
+    :return: A table representing the rows passed in.
+    """
+    stringified, has_labels = _stringify(rows, labels)
+    if len(stringified) * len(stringified[0]) > CACHE_MAX_CELLS:
+        return _render_table(stringified, has_labels, centered)
+    return _cached_render_table(stringified, has_labels, centered)
+
+
+def _stringify(
+    rows: List[List[Any]], labels: Optional[List[Any]]
+) -> Tuple[Tuple[Tuple[str, ...], ...], bool]:
+    """Validates the table shape and returns the stringified labels (if any) and rows as one matrix,
+    along with whether its first row holds the labels."""
+    # Make sure there is at least one row and all rows have the same number of columns
+    assert rows
+    n_cols = len(rows[0])
+    assert all(len(row) == n_cols for row in rows)
 
     if labels := labels or []:
         assert n_cols == len(labels)
 
-    cols = list(zip(*rows))  # transpose the rows so we can iterate over columns
-    for i in range(n_cols):
-        len_label = 0 if not labels else len(str(labels[i]))
-        # each column will be as wide as the longest label or row string, excluding padding
-        column_widths[i] = max(len_label, *(len(str(obj)) for obj in cols[i]))
-    
+    # stringify the labels (if any) and every cell exactly once; widths and rendering both work off these
+    # strings (`map(str, ...)` keeps the per-cell loop in C)
+    stringified = tuple(tuple(map(str, row)) for row in chain([labels] if labels else [], rows))
+    return stringified, bool(labels)
+
+
+def _render_table(stringified: Tuple[Tuple[str, ...], ...], has_labels: bool, centered: bool) -> str:
+    """Renders the already-stringified table, whose first row holds the labels if `has_labels`."""
+    # each column will be as wide as the longest label or row string; scan row by row rather than
+    # transposing so we never build the column tuples
+    column_widths = [0] * len(stringified[0])
+    for row in stringified:
+        for i, col in enumerate(row):
+            if (col_len := len(col)) > column_widths[i]:
+                column_widths[i] = col_len
+    padded_widths = tuple(column_width + 2 for column_width in column_widths)  # +2 for padding
+
+    render_row = _make_row_format(padded_widths, centered).format
+    segments = [HORIZONTAL * column_width for column_width in padded_widths]  # shared by every rule
+
     # final table: top rule, header row (if labels given), header rule (if labels given), rows, bottom rule
-    return "\n".join(
-        [make_horizontal_rule(column_widths, "top")]
-        + ([process_row(labels, column_widths, centered)] if labels else [])
-        + ([make_horizontal_rule(column_widths, "header")] if labels else [])
-        + [process_row(row, column_widths, centered) for row in rows]
-        + [make_horizontal_rule(column_widths, "bottom")]
-    )
+    parts = [make_horizontal_rule(segments, "top")]
+    if has_labels:
+        parts.append(render_row(*stringified[0]))
+        parts.append(make_horizontal_rule(segments, "header"))
+    parts.extend(starmap(render_row, islice(stringified, 1 if has_labels else 0, None)))  # no slice copy
+    parts.append(make_horizontal_rule(segments, "bottom"))
+    return "\n".join(parts)
 
 
-def pad_column(column_object: Any, column_width: int, centered: bool) -> str:
-    """Pads the string representation of column_object up to `column_width` using the given formatting
-    rule (centered or not centered). Extra spaces for unevenly centered columns pad to the right.
-    """
-    column_text = f" {column_object} "  # padded by at least one space on either side
-    pad = column_width + 2 - len(column_text)  # number of additional spaces we need to pad with
-    if not centered:  # left justified, pad to the right
-        return column_text + " " * pad
-    if centered:  # centered, pad evenly on both sides, extra spaces on the right
-        left_pad, right_pad = pad // 2, math.ceil(pad / 2)
-        return " " * left_pad + column_text + " " * right_pad
+# Cached on the strings rather than the original objects: those may be unhashable or mutable, and
+# equal-but-differently-printed values (1, 1.0, True) would otherwise share an entry.
+_cached_render_table = lru_cache(maxsize=16)(_render_table)
 
 
-def process_row(row: List[Any], column_widths: List[int], centered: bool) -> List[str]:
-    """Returns the string representation of each row. Each column is separated by vertical bars"""
+@lru_cache(maxsize=128)
+def _make_row_format(column_widths: Tuple[int, ...], centered: bool) -> str:
+    """Builds a `str.format` template that renders a whole row in one call. Each field is padded by one
+    space on either side and aligned to its column; extra spaces for unevenly centered columns pad to the
+    right. Cached per layout, so tables sharing a shape reuse the same template.
+    """
+    align = "^" if centered else "<"
     return (
         VERTICAL
-        + VERTICAL.join(
-            pad_column(col, column_width, centered)
-            for col, column_width in zip(row, column_widths)
-        )
+        + VERTICAL.join(f" {{:{align}{column_width - 2}}} " for column_width in column_widths)
         + VERTICAL
     )
 